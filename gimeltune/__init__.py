@@ -27,7 +27,7 @@ __version__ = "0.1.0"
 __gimeltune_folder__ = os.path.join(dirname(abspath(__file__)))
 __project_folder__ = dirname(__gimeltune_folder__)
 
-from .jobs import create_job, load_job
+from .jobs import batched_objective, create_job, load_job
 from .models import Experiment
 from .search import Categorical, Integer, Real, SearchSpace
 from .search.algorithms import (
@@ -37,4 +37,4 @@ from .search.algorithms import (
     SeedAlgorithm,
     SkoptBayesianAlgorithm,
 )
-from .storages import Storage, TinyDBStorage
+from .storages import MemoryStorage, Storage, TinyDBStorage
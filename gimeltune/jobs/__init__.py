@@ -1 +1,2 @@
+from .batch import Batch, batched_objective
 from .job import create_job, load_job
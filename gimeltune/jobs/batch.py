@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (c) 2021 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import functools
+from typing import Callable, List
+
+import numpy as np
+
+from gimeltune.models import Experiment
+
+__all__ = ["Batch", "batched_objective"]
+
+
+class Batch:
+    """
+    Batch of experiments passed to batched objectives.
+
+    Values of `params` are numpy arrays of parameter
+    values, one item per experiment.
+    """
+
+    def __init__(self, experiments: List[Experiment]):
+        self.experiments = experiments
+        self.params = {
+            name: np.array([e.params[name] for e in experiments])
+            for name in (experiments[0].params if experiments else ())
+        }
+
+    def __len__(self):
+        return len(self.experiments)
+
+
+def batched_objective(objective: Callable) -> Callable:
+    """
+    Mark objective as evaluating a whole batch of experiments at once.
+
+    Objective takes `Batch` and returns array-like of
+    objective results in the same order as experiments.
+
+    :param objective: objective function.
+    :return: batched objective.
+    """
+
+    @functools.wraps(objective)
+    def wrapper(batch: Batch):
+        return objective(batch)
+
+    wrapper.__gimeltune_batched__ = True
+    return wrapper
+
+
+def is_batched(objective: Callable) -> bool:
+    return getattr(objective, '__gimeltune_batched__', False)
@@ -19,19 +19,22 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import contextlib
+import gc
+import hashlib
 import inspect
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, Union
 
 import multiprocess as mp
-import pandas as pd
+import numpy as np
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import ArgumentError
 
-from rich.progress import Progress
-
 from gimeltune.exceptions import (
     DuplicatedJobError,
     ExperimentNotFinishedError,
@@ -40,6 +43,7 @@ from gimeltune.exceptions import (
     JobNotFoundError,
     SearchAlgorithmNotFoundedError, InvalidOptimizer,
 )
+from gimeltune.jobs.batch import Batch, is_batched
 from gimeltune.models import Experiment, Result
 from gimeltune.models.experiment import ExperimentState
 from gimeltune.search import SearchSpace, RoundRobinMeta
@@ -47,21 +51,52 @@ from gimeltune.search.algorithms import (
     SearchAlgorithm,
     SeedAlgorithm,
     SkoptBayesianAlgorithm,
-    get_algo,
+    get_algorithm,
 )
 from gimeltune.search.meta import MetaSearchAlgorithm
-from gimeltune.storages import Storage, TinyDBStorage
+from gimeltune.storages import MemoryStorage, Storage, TinyDBStorage
+from gimeltune.utils import serialization
+from gimeltune.utils.results import improvements_mask
 
 __all__ = ["create_job", "load_job"]
 
 from gimeltune.storages.rdb.storage import RDBStorage
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _algo_from_class(algo_cls: Type[SearchAlgorithm],
+                     search_space: SearchSpace):
+    # noinspection PyArgumentList
+    return algo_cls(search_space=search_space)
+
+
+# Algorithm factories by type of `algo_list` item,
+# subclasses (e.g. str enums) use factories of their bases.
+_ALGO_FACTORIES = {
+    str: get_algorithm,
+}
+
+
+def _algo_factory(algo):
+    for cls in type(algo).__mro__:
+        factory = _ALGO_FACTORIES.get(cls)
+
+        if factory is not None:
+            return factory
+
+    return None
+
 
 class Job:
     """
     Facade of framework.
     """
 
+    # Max count of re-asks for batches of already evaluated configurations.
+    ask_retries = 10
+
     def __init__(
         self,
         name: str,
@@ -92,11 +127,23 @@ class Job:
 
         self.search_space = search_space
         self.pending_experiments = 0
+        self._experiments_count_cache: Optional[int] = None
 
         self.seeds = []
+        # Objective results by configuration digest, built from stored
+        # experiments when memoization is first enabled. Lookups happen
+        # in the parent process, so a plain dict is enough for any n_proc.
+        self._obj_cache: Optional[dict] = None
+
+        self.storage.insert_job(self)
 
-        if not self.storage.is_job_name_exists(self.name):
-            self.storage.insert_job(self)
+        # Count of improvements of the best result and the best result
+        # itself, loaded once and then maintained by `tell`.
+        objective_results = np.array(
+            self.storage.get_objective_results(self.id), dtype=np.float64)
+        self._rewards = int(np.sum(improvements_mask(objective_results)))
+        self._best_so_far = float(
+            np.fmin.reduce(objective_results, initial=np.inf))
 
     @property
     def best_parameters(self) -> Optional[dict]:
@@ -144,11 +191,18 @@ class Job:
     @property
     def experiments_count(self) -> int:
         """
+        Get count of finished experiments in job.
+        Storage is queried only once, after that
+        the count is maintained locally by `tell`.
 
-        :return:
+        :return: experiments count.
         """
 
-        return self.storage.get_experiments_count(self.id)
+        if self._experiments_count_cache is None:
+            self._experiments_count_cache = \
+                self.storage.get_experiments_count(self.id)
+
+        return self._experiments_count_cache
 
     def top_experiments(self, n: int):
         """
@@ -161,17 +215,14 @@ class Job:
         return self.storage.top_experiments(self.id, n)
 
     @property
-    def rewards(self):
-        rewards = 0
-        experiments = self.experiments
-        m = float('+inf')
+    def rewards(self) -> int:
+        """
+        Get count of experiments which improved the best result.
 
-        for exp in experiments:
-            if exp.objective_result < m:
-                rewards += 1
-                m = exp.objective_result
+        :return: rewards count.
+        """
 
-        return rewards
+        return self._rewards
 
     def setup_default_algo(self):
         self.add_algorithm(
@@ -186,22 +237,19 @@ class Job:
                 SkoptBayesianAlgorithm(self.search_space))
         else:
             for algo in algo_list:
-                if isinstance(algo, str):
-                    try:
-                        algo_cls = get_algo(algo)
-                    except SearchAlgorithmNotFoundedError:
+                factory = _algo_factory(algo)
+
+                if factory is None:
+                    if isinstance(algo, SearchAlgorithm):
+                        self.add_algorithm(algo)
+                        continue
+                    elif (inspect.isclass(algo) and
+                          issubclass(algo, SearchAlgorithm)):
+                        factory = _algo_from_class
+                    else:
                         raise SearchAlgorithmNotFoundedError()
-                elif isinstance(algo, SearchAlgorithm):
-                    self.add_algorithm(algo)
-                    continue
-                elif issubclass(algo, SearchAlgorithm):
-                    algo_cls = algo
-                else:
-                    raise SearchAlgorithmNotFoundedError()
 
-                # noinspection PyArgumentList
-                self.add_algorithm(
-                    algo_cls(search_space=self.search_space))
+                self.add_algorithm(factory(algo, self.search_space))
 
     def do(
         self,
@@ -211,6 +259,11 @@ class Job:
         algo_list: List[Union[str, Type[SearchAlgorithm]]] = None,
         clear=True,
         progress_bar=True,
+        memoize=False,
+        start_method: Optional[str] = None,
+        gc_after_trial=False,
+        batch: Optional[int] = None,
+        parallel=False,
     ):
         """
         :param objective: objective function
@@ -219,6 +272,19 @@ class Job:
         :param algo_list: chosen search algorithm's list.
         :param clear: clear algo list or not.
         :param progress_bar: show progress bar or not.
+        :param memoize: reuse objective results for already
+            evaluated configurations instead of calling objective again,
+            only for deterministic objectives (noisy measurements,
+            e.g. timings, must be repeated).
+        :param start_method: start method of worker processes
+            ('fork', 'spawn' or 'forkserver'), platform default if None.
+        :param gc_after_trial: run garbage collector after
+            each evaluated batch of configurations.
+        :param batch: count of configurations gathered from
+            optimizer before evaluation. Objectives marked with
+            `batched_objective` are called once per such batch.
+        :param parallel: ask independent search algorithms of
+            optimizer's round concurrently in threads.
         :return: None
         """
 
@@ -234,13 +300,33 @@ class Job:
         ):
             self._load_algo(algo_list)
 
+        # Imported here to keep `import gimeltune` light.
+        from rich.progress import Progress
+
+        batched = is_batched(objective)
+        # Once built, cache is kept up to date by later runs too.
+        cache = self._memo_cache() if memoize else self._obj_cache
         trials = 0
-        with Progress(transient=True, disable=not progress_bar) as bar:
+        # Batched objectives are evaluated in this process.
+        pool = (
+            contextlib.nullcontext() if batched else
+            mp.get_context(start_method).Pool(n_proc)
+        )
+        # noinspection PyUnresolvedReferences
+        with Progress(transient=True, disable=not progress_bar) as bar, \
+                pool, self._parallel_asks(parallel):
             task = bar.add_task('Optimizing', total=n_trials)
             while trials < n_trials:
-                bar.tasks[task].completed = trials
+                configurations = self.ask(skip_evaluated=memoize)
+                exhausted = not configurations
 
-                configurations = self.ask()
+                while (
+                    not exhausted and batch and
+                    len(configurations) < min(batch, n_trials - trials)
+                ):
+                    more = self.ask(skip_evaluated=memoize)
+                    exhausted = not more
+                    configurations += more or []
 
                 if not configurations:
                     warnings.warn("No new configurations.")
@@ -249,14 +335,85 @@ class Job:
 
                 trials += len(configurations)
 
-                # noinspection PyUnresolvedReferences
-                with mp.Pool(n_proc) as p:
-                    results = p.map(objective, configurations)
+                keys = (None if cache is None else
+                        [_params_digest(c.params) for c in configurations])
+                results = [None] * len(configurations)
+                pending = []
+                # Configurations evaluated before are already skipped by
+                # `ask`, only repeats within the batch are left: pairs of
+                # (index, index of the first same configuration).
+                repeated = []
+                seen = dict()
+
+                for i, experiment in enumerate(configurations):
+                    if memoize and keys[i] in seen:
+                        repeated.append((i, seen[keys[i]]))
+                        continue
+
+                    if memoize:
+                        seen[keys[i]] = i
+
+                    pending.append((i, experiment))
+
+                # Results arrive in completion order, so slow trials
+                # do not hold back the progress of the whole batch.
+                if batched:
+                    evaluated = _evaluate_batch(objective, pending)
+                else:
+                    evaluated = pool.imap_unordered(
+                        partial(_evaluate, objective),
+                        pending,
+                        chunksize=max(1, len(pending) // (4 * n_proc)),
+                    )
+
+                for i, result in evaluated:
+                    results[i] = result
+                    bar.advance(task)
+
+                    if cache is not None:
+                        cache[keys[i]] = result
+
+                for i, first in repeated:
+                    results[i] = results[first]
+                    bar.advance(task)
 
                 # Applying result
                 for experiment, result in zip(configurations, results):
                     experiment.success_finish()
-                    self.tell(experiment, result)
+                    self._finish(experiment, result)
+
+                self.optimizer.tell_bulk(
+                    [e.params for e in configurations],
+                    [e.objective_result for e in configurations],
+                )
+
+                self._insert_experiments(configurations)
+
+                # Drop batch references before asking for the next one.
+                del configurations, results, pending, repeated, seen, \
+                    evaluated
+
+                if gc_after_trial:
+                    gc.collect()
+
+                if exhausted:
+                    warnings.warn("No new configurations.")
+                    break
+
+    @contextlib.contextmanager
+    def _parallel_asks(self, enabled):
+        if not enabled:
+            yield
+            return
+
+        workers = max(1, len(self.optimizer.algorithms))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            self.optimizer.executor = executor
+            try:
+                yield
+            finally:
+                self.optimizer.executor = None
 
     def tell(self, experiment, result: Union[float, Result]):
         """
@@ -266,33 +423,91 @@ class Job:
         :raises:
         """
 
+        self._apply(experiment, result)
+        self._insert_experiments([experiment])
+
+    def _apply(self, experiment, result: Union[float, Result]):
+        self._finish(experiment, result)
+
+        if self._obj_cache is not None:
+            self._obj_cache[_params_digest(experiment.params)] = result
+
+        self.optimizer.tell(experiment.params, experiment.objective_result)
+
+    def _finish(self, experiment, result: Union[float, Result]):
+        """Apply result to finished experiment, optimizer is not told."""
+
         if experiment.is_finished():
             self.pending_experiments -= 1
 
             if isinstance(result, Result):
-                self.optimizer.tell(experiment.params, result.objective_result)
                 experiment.apply(result.objective_result)
                 experiment.metrics = result.metrics
             else:
-                self.optimizer.tell(experiment.params, result)
                 experiment.apply(result)
 
-            self.storage.insert_experiment(experiment)
+            value = experiment.objective_result
+
+            if value is not None and value < self._best_so_far:
+                self._rewards += 1
+                self._best_so_far = value
+
             return
 
         raise ExperimentNotFinishedError()
 
+    def _insert_experiments(self, experiments: List[Experiment]):
+        self.storage.insert_experiments(experiments)
+
+        if self._experiments_count_cache is not None:
+            self._experiments_count_cache += len(experiments)
+
     def _tell_for_loaded(self, experiment: Experiment):
         self.optimizer.tell(experiment.params, experiment.objective_result)
 
-    def ask(self) -> Optional[List[Experiment]]:
+    def _memo_cache(self) -> dict:
+        """Objective results cache, filled from stored experiments."""
+
+        if self._obj_cache is None:
+            self._obj_cache = {
+                _params_digest(e.params): (
+                    Result(objective_result=e.objective_result,
+                           metrics=e.metrics)
+                    if e.metrics else e.objective_result
+                )
+                for e in self.experiments
+                if e.objective_result is not None
+            }
+
+        return self._obj_cache
+
+    def ask(self, skip_evaluated=False) -> Optional[List[Experiment]]:
         """
         Ask for a new experiment.
-        :return:
+
+        :param skip_evaluated: drop configurations with already known
+            objective results and ask optimizer again if all of them
+            are dropped (at most `ask_retries` times).
+        :return: new experiments, empty if there are no (new) ones.
         """
 
         configs = self.optimizer.ask()
+        retries = self.ask_retries
+
+        cache = self._memo_cache() if skip_evaluated else None
 
+        while skip_evaluated and configs:
+            configs = [c for c in configs
+                       if _params_digest(c) not in cache]
+
+            if configs or not retries:
+                break
+
+            retries -= 1
+            configs = self.optimizer.ask()
+
+        # If retries are exhausted, search space is considered
+        # exhausted too, replays are not stored as new experiments.
         if not configs:
             return configs
 
@@ -302,11 +517,14 @@ class Job:
             state=ExperimentState.WIP,
         )
 
+        base = self.experiments_count + self.pending_experiments
+        now = time.time()
+
         experiments = [
             applyer(
                 params=config,
-                id=self.experiments_count + self.pending_experiments + i,
-                create_timestamp=datetime.timestamp(datetime.now())
+                id=base + i,
+                create_timestamp=now
             )
             for i, config in enumerate(configs)
         ]
@@ -316,63 +534,43 @@ class Job:
         return experiments
 
     def get_dataframe(self, brief=False, desc=False):
-        container = []
-        m = float('+inf')
+        import pandas as pd
 
-        for experiment in self.experiments:
-            dataframe_dict = experiment.dict()
+        experiments = self.experiments
 
-            if dataframe_dict['objective_result'] < m:
-                m = dataframe_dict['objective_result']
-            else:
-                if desc:
-                    continue
+        if not experiments:
+            return pd.DataFrame()
 
-            params = {
-                f'param_{key}': value
-                for key, value in dataframe_dict.pop("params").items()
-            }
+        objective_results = np.array(
+            [e.objective_result for e in experiments], dtype=np.float64)
 
-            metrics = dataframe_dict.pop("metrics") or dict()
+        if desc:
+            mask = improvements_mask(objective_results)
+            experiments = [e for e, keep in zip(experiments, mask) if keep]
+            objective_results = objective_results[mask]
 
-            dataframe_dict["create_time"] = datetime.fromtimestamp(
-                dataframe_dict["create_timestamp"])
+        columns = {
+            'id': np.array([e.id for e in experiments], dtype=np.int64),
+        }
 
-            dataframe_dict["finish_time"] = datetime.fromtimestamp(
-                dataframe_dict["finish_timestamp"])
+        if not brief:
+            columns['state'] = [str(e.state) for e in experiments]
 
-            del dataframe_dict["create_timestamp"]
-            del dataframe_dict["finish_timestamp"]
-            del dataframe_dict["hash"]
-            del dataframe_dict["job_id"]
+        columns['objective_result'] = objective_results
 
-            dataframe_dict["state"] = str(dataframe_dict["state"])
-
-            if brief:
-                idx = dataframe_dict['id']
-                objective_result = dataframe_dict['objective_result']
-                container.append(
-                    {
-                        'id': idx,
-                        'objective_result': objective_result,
-                        **params,
-                        **metrics,
-                    }
-                )
-                continue
-
-            container.append(
-                {
-                    **dataframe_dict,
-                    **params,
-                    **metrics,
-                }
-            )
+        if not brief:
+            columns['create_time'] = _to_datetime(
+                [e.create_timestamp for e in experiments])
+            columns['finish_time'] = _to_datetime(
+                [e.finish_timestamp for e in experiments])
 
-        df = pd.DataFrame(container)
+        params = pd.DataFrame.from_records(
+            [e.params for e in experiments]).add_prefix('param_')
+        metrics = pd.DataFrame.from_records(
+            [e.metrics or dict() for e in experiments])
 
-        if container:
-            df.set_index('id', inplace=True)
+        df = pd.concat([pd.DataFrame(columns), params, metrics], axis=1)
+        df.set_index('id', inplace=True)
 
         return df
 
@@ -387,7 +585,42 @@ class Job:
         self.seeds.append(seed)
 
 
-def _load_storage(storage_or_name: Union[str, Optional[Storage]]) -> Storage:
+def _to_datetime(timestamps: List[Optional[float]]) -> 'pd.DatetimeIndex':
+    import pandas as pd
+    from dateutil.tz import tzlocal
+
+    # Naive local time, like `datetime.fromtimestamp`.
+    return (pd.to_datetime(timestamps, unit='s',
+                           utc=True).tz_convert(tzlocal()).tz_localize(None))
+
+
+def _params_digest(params: dict) -> bytes:
+    dumped = serialization.dumps(params, sort_keys=True, default=str)
+    return hashlib.blake2b(dumped, digest_size=16).digest()
+
+
+def _evaluate(objective: Callable, indexed_experiment):
+    index, experiment = indexed_experiment
+    return index, objective(experiment)
+
+
+def _evaluate_batch(objective: Callable, indexed_experiments):
+    if not indexed_experiments:
+        return []
+
+    indexes, experiments = zip(*indexed_experiments)
+    results = np.asarray(objective(Batch(list(experiments))))
+
+    if results.ndim != 1 or len(results) != len(indexes):
+        raise ValueError(
+            f"Batched objective must return {len(indexes)} results "
+            f"(one per configuration), got array of shape {results.shape}.")
+
+    return zip(indexes, results.tolist())
+
+
+def _load_storage(storage_or_name: Union[str, Optional[Storage]],
+                  pool_size: Optional[int] = None) -> Storage:
     if storage_or_name is None:
         return RDBStorage("sqlite:///:memory:")
 
@@ -402,12 +635,15 @@ def _load_storage(storage_or_name: Union[str, Optional[Storage]]) -> Storage:
     except ArgumentError:
         raise InvalidStorageRFC1738()
 
+    if url.drivername == "memory":
+        return MemoryStorage()
+
     assert url.database
 
     if url.drivername == "tinydb":
         return TinyDBStorage(str(url.database))
 
-    return RDBStorage(storage_or_name)
+    return RDBStorage(storage_or_name, pool_size=pool_size)
 
 
 def create_job(
@@ -415,6 +651,7 @@ def create_job(
     search_space: SearchSpace,
     name: str = None,
     storage: Union[str, Optional[Storage]] = None,
+    pool_size: Optional[int] = None,
     **kwargs,
 ):
     """
@@ -422,12 +659,14 @@ def create_job(
     :param search_space:
     :param name:
     :param storage:
+    :param pool_size: connections pool size for
+        server-based RDB storages passed by URL.
     :return:
     """
 
     name = name or "job" + datetime.now().strftime("%H_%M_%S_%m_%d_%Y")
 
-    storage = _load_storage(storage)
+    storage = _load_storage(storage, pool_size)
 
     assert isinstance(name, str)
     assert isinstance(search_space, SearchSpace)
@@ -441,16 +680,19 @@ def create_job(
 def load_job(*, search_space: SearchSpace,
              name: str,
              storage: Union[str, Storage] = None,
+             pool_size: Optional[int] = None,
              **kwargs):
     """
 
     :param search_space:
     :param name:
     :param storage:
+    :param pool_size: connections pool size for
+        server-based RDB storages passed by URL.
     :return:
     """
 
-    storage = _load_storage(storage)
+    storage = _load_storage(storage, pool_size)
 
     job_id = storage.get_job_id_by_name(name)
 
@@ -3,6 +3,9 @@ from pprint import pformat
 
 class Configuration(dict):
 
+    # No per-instance __dict__, experiments keep one configuration each.
+    __slots__ = ('requestor',)
+
     def __init__(self, *args, requestor='UNKNOWN', **kwargs):
         super().__init__(*args, **kwargs)
         self.requestor = requestor
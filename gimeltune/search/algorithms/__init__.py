@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import functools
 
 from ...exceptions import SearchAlgorithmNotFoundedError
 from .algorithm import SearchAlgorithm
@@ -32,12 +33,39 @@ from .templatesearch import TemplateSearchAlgorithm
 registry = {}
 
 
+@functools.lru_cache(maxsize=None)
+def get_algo(algo_name):
+    algo = registry.get(algo_name, None)
+
+    if not algo:
+        raise SearchAlgorithmNotFoundedError()
+
+    return algo
+
+
+def get_algorithm(algo_name, search_space, **kwargs):
+    """
+    Make new instance of registered search algorithm.
+
+    Instances are not cached, unlike classes lookup:
+    algorithms keep state of the job they are used in.
+
+    :param algo_name: registered algorithm's name or alias.
+    :param search_space: search space of algorithm.
+    :return: search algorithm instance.
+    """
+
+    return get_algo(algo_name)(search_space=search_space, **kwargs)
+
+
 def register(algo_name, algo_cls, *algo_aliases):
     registry[algo_name] = algo_cls
 
     for alias in algo_aliases:
         registry[alias] = algo_cls
 
+    get_algo.cache_clear()
+
 
 register("skopt", SkoptBayesianAlgorithm, "Skopt")
 register("bayesian", BayesianAlgorithm, "bayes, Bayesian")
@@ -46,12 +74,3 @@ register("random", RandomSearch, "Random", "RandomSearch")
 register("grid", GridSearch, "Grid", "GridSearch")
 register("template", TemplateSearchAlgorithm, "template-search",
          "basic-template")
-
-
-def get_algo(algo_name):
-    algo = registry.get(algo_name, None)
-
-    if not algo:
-        raise SearchAlgorithmNotFoundedError()
-
-    return algo
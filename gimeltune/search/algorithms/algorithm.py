@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import abc
+from functools import partial
 from typing import List, Optional
 
 __all__ = ["SearchAlgorithm"]
@@ -29,7 +30,7 @@ from gimeltune.models.configuration import Configuration
 
 class SearchAlgorithm(metaclass=abc.ABCMeta):
     def __init__(self, *args, **kwargs):
-        self._name = self.__class__.__name__
+        self.name = self.__class__.__name__
 
     @abc.abstractmethod
     def ask(self) -> Optional[List[Configuration]]:
@@ -46,3 +47,5 @@ class SearchAlgorithm(metaclass=abc.ABCMeta):
     @name.setter
     def name(self, v):
         self._name = v
+        # Configuration factory bound to the current requestor name.
+        self._make_config = partial(Configuration, requestor=v)
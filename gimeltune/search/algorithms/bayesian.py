@@ -1,14 +1,158 @@
+import math
 from typing import List, Optional, Generator
 
 import numpy as np
+from scipy.linalg import cho_solve, cholesky, solve_triangular
 from scipy.stats import norm
+from sklearn.ensemble import (
+    BaseEnsemble,
+    ExtraTreesRegressor,
+    RandomForestRegressor,
+)
 from sklearn.gaussian_process import GaussianProcessRegressor
 
 from gimeltune.models.configuration import Configuration
 from gimeltune.models.experiment import Experiment
 from gimeltune.search.algorithms import SearchAlgorithm
 from gimeltune.search.parameters import Categorical, Integer, Real
+from gimeltune.search.space import INTEGER, REAL
 from gimeltune.search.visitors import Randomizer
+from gimeltune.utils.jit import HAS_NUMBA, njit
+
+
+# Division by zero std gives inf/nan like in numpy.
+@njit(cache=True, error_model='numpy')
+def _ei_loop(mean, std, best, xi):
+    scores = np.empty(mean.shape[0])
+
+    for i in range(mean.shape[0]):
+        a = mean[i] - best - xi
+        z = a / std[i]
+        cdf = 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+        pdf = math.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+        scores[i] = a * cdf + std[i] * pdf
+
+    return scores
+
+
+def _ei_numpy(mean, std, best, xi):
+    a = mean - best - xi
+    z = a / std
+    return a * norm.cdf(z) + std * norm.pdf(z)
+
+
+# Compiled loop avoids temporaries, without numba numpy is faster.
+expected_improvement = _ei_loop if HAS_NUMBA else _ei_numpy
+
+
+# Count of trees grown per refit of warm started forests.
+FOREST_GROWTH_STEP = 10
+
+
+# noinspection PyPep8Naming
+class IncrementalGaussianProcessRegressor(GaussianProcessRegressor):
+    """
+    Gaussian process regressor, which extends Cholesky factor
+    of kernel matrix on refit with observations appended to the
+    previous ones, instead of its recomputation.
+
+    Factor is reused only with fixed kernel hyperparameters
+    (`optimizer=None`, the default) and scalar `alpha`,
+    otherwise regressor is fully refitted.
+    """
+    def __init__(
+        self,
+        kernel=None,
+        *,
+        alpha=1e-10,
+        optimizer=None,
+        n_restarts_optimizer=0,
+        normalize_y=False,
+        copy_X_train=True,
+        random_state=None,
+    ):
+        super().__init__(
+            kernel=kernel,
+            alpha=alpha,
+            optimizer=optimizer,
+            n_restarts_optimizer=n_restarts_optimizer,
+            normalize_y=normalize_y,
+            copy_X_train=copy_X_train,
+            random_state=random_state,
+        )
+
+    def _extends_fitted(self, X):
+        if (
+            self.optimizer is not None or
+            np.ndim(self.alpha) != 0 or
+            not hasattr(self, 'L_')
+        ):
+            return False
+
+        if self.kernel is not None and self.kernel != self.kernel_:
+            return False
+
+        n = len(self.X_train_)
+
+        return (
+            X.ndim == 2 and
+            X.shape[0] > n and
+            X.shape[1] == self.X_train_.shape[1] and
+            np.array_equal(X[:n], self.X_train_)
+        )
+
+    def fit(self, X, y):
+        X = np.asarray(X)
+
+        if not self._extends_fitted(X):
+            return super().fit(X, y)
+
+        X, y = self._validate_data(X, y, multi_output=True, y_numeric=True)
+
+        n = len(self.X_train_)
+        X_new = X[n:]
+
+        # Block update of L L^T = K + alpha I:
+        # [[L, 0], [L12^T, L22]] with L L12 = K12
+        # and L22 L22^T = K22 - L12^T L12.
+        K12 = self.kernel_(self.X_train_, X_new)
+        K22 = self.kernel_(X_new)
+        K22[np.diag_indices_from(K22)] += self.alpha
+
+        L12 = solve_triangular(self.L_, K12, lower=True, check_finite=False)
+
+        try:
+            L22 = cholesky(K22 - L12.T @ L12, lower=True, check_finite=False)
+        except np.linalg.LinAlgError:
+            # Let full refit report the not positive definite kernel.
+            return super().fit(X, y)
+
+        L = np.zeros(shape=(len(X), len(X)))
+        L[:n, :n] = self.L_
+        L[n:, :n] = L12.T
+        L[n:, n:] = L22
+
+        if self.normalize_y:
+            self._y_train_mean = np.mean(y, axis=0)
+            std = np.std(y, axis=0)
+            self._y_train_std = np.where(
+                std < 10 * np.finfo(std.dtype).eps, 1.0, std)
+            y = (y - self._y_train_mean) / self._y_train_std
+
+        self.X_train_ = np.copy(X) if self.copy_X_train else X
+        self.y_train_ = np.copy(y) if self.copy_X_train else y
+        self.L_ = L
+        self.alpha_ = cho_solve((L, True), self.y_train_, check_finite=False)
+
+        y_2d = self.y_train_.reshape(len(X), -1)
+        alpha_2d = self.alpha_.reshape(len(X), -1)
+        self.log_marginal_likelihood_value_ = (
+            -0.5 * np.einsum('ik,ik->k', y_2d, alpha_2d) -
+            np.log(np.diag(L)).sum() -
+            len(X) / 2 * np.log(2 * np.pi)
+        ).sum()
+
+        return self
 
 
 # noinspection PyPep8Naming
@@ -19,6 +163,8 @@ class BayesianAlgorithm(SearchAlgorithm):
         *args,
         acq_function='ei',
         regressor=GaussianProcessRegressor,
+        warm_start=False,
+        xi=0.0,
         **kwargs
     ):
 
@@ -27,43 +173,68 @@ class BayesianAlgorithm(SearchAlgorithm):
         self._ask_gen = self._ask()
         self.model = regressor()
 
-        self.bounds = []
-
-        for p in self.search_space:
-            if isinstance(p, (Integer, Real)):
-                self.bounds.append((p.low, p.high))
-            if isinstance(p, Categorical):
-                self.bounds.append((0, len(p.choices) - 1))
-
-        self.bounds = np.array(self.bounds)
-
-        self.X = np.empty(shape=(0, len(self.search_space)))
-        self.y = np.empty(shape=(0, ))
+        # Max count of trees of warm started forest.
+        self._forest_size = None
+
+        if not warm_start:
+            pass
+        elif isinstance(self.model,
+                        (RandomForestRegressor, ExtraTreesRegressor)):
+            self._forest_size = self.model.n_estimators
+            self.model.set_params(warm_start=True)
+        # Other ensembles don't learn new observations on warm start
+        # without growing of estimators count, so they are refitted.
+        elif (
+            not isinstance(self.model, BaseEnsemble) and
+            'warm_start' in self.model.get_params()
+        ):
+            self.model.set_params(warm_start=True)
+
+        # Count of observations the model is fitted on.
+        self._fitted_count = None
+
+        self.bounds = np.column_stack((self.search_space.lows,
+                                       self.search_space.highs))
+
+        # Observations buffers grow geometrically, `X` and `y`
+        # are views of their filled part.
+        self._X = np.empty(shape=(16, len(self.search_space)))
+        self._y = np.empty(shape=(16, ))
+        self._n_observations = 0
         self.random_generator = np.random.RandomState(0)
         self.n_warmup = 5
+        self.xi = xi
         self.acq_function = (
             acq_function
             if isinstance(self.model, GaussianProcessRegressor)
             else 'mc'
         )
-        self._name = f'Bayesian<{regressor.__name__}({self.acq_function})>'
+        self.name = f'Bayesian<{regressor.__name__}({self.acq_function})>'
+
+    @property
+    def X(self):
+        return self._X[:self._n_observations]
+
+    @property
+    def y(self):
+        return self._y[:self._n_observations]
 
     def ask(self) -> Optional[List[Configuration]]:
         return next(self._ask_gen)
 
     def _to_gt_config(self, x):
         configuration = {}
+        # Half away from zero, then truncation like `int`.
+        rounded = np.where(x > 0, x + 0.5, x - 0.5).astype(int).tolist()
 
-        for p, v in zip(self.search_space, x):
-            if isinstance(p, Real):
+        for p, kind, v, r in zip(self.search_space, self.search_space.kinds,
+                                 x, rounded):
+            if kind == REAL:
                 configuration[p.name] = v
-
-            rounded = int(v + (0.5 if v > 0 else -0.5))
-
-            if isinstance(p, Integer):
-                configuration[p.name] = rounded
-            elif isinstance(p, Categorical):
-                configuration[p.name] = p.choices[rounded]
+            elif kind == INTEGER:
+                configuration[p.name] = r
+            else:
+                configuration[p.name] = p.choices[r]
 
         return configuration
 
@@ -82,33 +253,50 @@ class BayesianAlgorithm(SearchAlgorithm):
         return vec
 
     def _ask(self) -> Generator:
-        randomizer = Randomizer()
+        sample_one = Randomizer().sampler(self.search_space)
         random_samples = [
-            Configuration(
-                {
-                    p.name: p.accept(randomizer) for p in self.search_space
-                },
-                requestor=self.name
-            )
+            self._make_config(sample_one())
             for _ in range(self.n_warmup)
         ]
 
         yield random_samples
 
-        self.model.fit(self.X, self.y)
+        self._fit()
 
         while True:
             x = self.opt_acquisition()
             cfg = self._to_gt_config(x)
-            yield [Configuration(cfg, requestor=self.name)]
+            yield [self._make_config(cfg)]
+            self._fit()
+
+    def _fit(self):
+        # Model is refitted only if new observations are told.
+        if self._fitted_count != len(self.y):
+            if self._forest_size:
+                self._make_room_in_forest()
+
             self.model.fit(self.X, self.y)
+            self._fitted_count = len(self.y)
+
+    def _make_room_in_forest(self):
+        # Warm started forest fits only trees above its current size,
+        # so a few new trees are added on all observations, while the
+        # oldest ones (fitted on fewer observations) are dropped.
+        step = min(FOREST_GROWTH_STEP, self._forest_size)
+        trees = getattr(self.model, 'estimators_', [])
+        kept = trees[max(0, len(trees) - (self._forest_size - step)):]
+
+        if trees:
+            self.model.estimators_ = kept
+
+        self.model.n_estimators = len(kept) + step
 
     def acquisition(self, X_samples):
         yhat = self.model.predict(self.X)
-        best = min(yhat)
+        best = yhat.min()
 
         if self.acq_function == 'mc':
-            return np.array([max(0, best - y) for y in yhat])
+            return np.maximum(0, best - yhat)
 
         mean, std = self.model.predict(X_samples, return_std=True)
         kappa = 2.5
@@ -117,19 +305,14 @@ class BayesianAlgorithm(SearchAlgorithm):
             probs = norm.cdf((mean - best) / (std + 1e-9))
             return probs
         elif self.acq_function == "ei":
-            a = mean - best
-            z = a / std
-            return a * norm.cdf(z) + std * norm.pdf(z)
+            return expected_improvement(mean, std, best, self.xi)
         elif self.acq_function == "ucb":
             return mean + kappa * std
 
     def opt_acquisition(self):
         n_warmup = 10000
 
-        x_tries = self.random_generator.uniform(self.bounds[:, 0],
-                                                self.bounds[:, 1],
-                                                size=(n_warmup,
-                                                      self.bounds.shape[0]))
+        x_tries = self.search_space.sample(n_warmup, self.random_generator)
 
         scores = self.acquisition(x_tries)
         minima_x = x_tries[scores.argmin()]
@@ -137,7 +320,12 @@ class BayesianAlgorithm(SearchAlgorithm):
         return minima_x
 
     def tell(self, config, result):
-        vec = np.array(self._to_gp_config(config))
+        n = self._n_observations
+
+        if n == len(self._y):
+            self._X = np.concatenate([self._X, np.empty_like(self._X)])
+            self._y = np.concatenate([self._y, np.empty_like(self._y)])
 
-        self.X = np.concatenate([self.X, vec.reshape(1, -1)])
-        self.y = np.concatenate([self.y, [result]])
+        self._X[n] = self._to_gp_config(config)
+        self._y[n] = result
+        self._n_observations += 1
@@ -19,8 +19,9 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import math
+import operator
 import warnings
-from itertools import product
 from typing import List, Optional, Generator
 
 import numpy
@@ -45,8 +46,11 @@ class GridMaker(ParametersVisitor):
         return range(p.low, p.high + 1)
 
     def visit_real(self, p: Real):
-        return numpy.round(
-            numpy.arange(p.low, p.high + GridMaker.EPS, GridMaker.EPS), 2)
+        # Points are taken by index, so `arange` float step
+        # accumulation can not overshoot the high bound.
+        count = int((p.high - p.low) / GridMaker.EPS + 1e-9) + 1
+        last = p.low + (count - 1) * GridMaker.EPS
+        return numpy.round(numpy.linspace(p.low, last, count), 2).tolist()
 
     def visit_categorical(self, p: Categorical):
         return p.choices
@@ -57,9 +61,16 @@ class GridSearch(SearchAlgorithm):
         super().__init__(*args, **kwargs)
         self.search_space = search_space
 
-        grids = [p.accept(GridMaker()) for p in self.search_space.params]
+        self._names = tuple(p.name for p in self.search_space.params)
+        self._grids = [p.accept(GridMaker()) for p in self.search_space.params]
+
+        # The product is never materialized: flat indexes are decoded
+        # into per-parameter indexes batch by batch, and values are taken
+        # from per-parameter grids to keep their python types.
+        self._shape = tuple(len(g) for g in self._grids)
+        self._size = math.prod(self._shape)
+        self._idx = 0
 
-        self.prod_iter = product(*grids)
         self._ask_gen = self._ask()
 
     @property
@@ -70,29 +81,32 @@ class GridSearch(SearchAlgorithm):
     def ask(self) -> Optional[List[Configuration]]:
         return next(self._ask_gen)
 
-    def _ask(self) -> Generator:
+    def _unravel(self, start, stop):
+        flat = numpy.arange(start, stop, dtype=numpy.int64)
+        indexes = numpy.empty((flat.size, len(self._shape)), dtype=numpy.int64)
 
-        while True:
+        for axis in reversed(range(len(self._shape))):
+            flat, indexes[:, axis] = numpy.divmod(flat, self._shape[axis])
 
-            cfgs = []
+        return indexes.tolist()
 
-            for i in range(self.per_emit_count):
-                try:
-                    generation = next(self.prod_iter)
-                except StopIteration:
-                    break
+    def _ask(self) -> Generator:
+
+        while True:
 
-                cfg = {
-                    h.name: v
-                    for h, v in zip(self.search_space, generation)
-                }
+            stop = min(self._idx + self.per_emit_count, self._size)
 
-                cfgs.append(Configuration(cfg, requestor=self.name))
+            cfgs = [
+                self._make_config(
+                    dict(zip(self._names,
+                             map(operator.getitem, self._grids, row)))
+                )
+                for row in self._unravel(self._idx, stop)
+            ]
 
-            if not cfgs:
-                yield None
+            self._idx = stop
 
-            yield cfgs
+            yield cfgs or None
 
     def tell(self, config, result):
         # no needed
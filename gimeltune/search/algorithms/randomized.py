@@ -19,7 +19,6 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import warnings
 from typing import List, Optional, Generator
 
 from gimeltune.models.configuration import Configuration
@@ -31,16 +30,23 @@ __all__ = ["RandomSearch"]
 
 
 class RandomSearch(SearchAlgorithm):
-    def __init__(self, search_space, *args, **kwargs):
+    def __init__(self,
+                 search_space,
+                 *args,
+                 per_emit_count=1,
+                 seed=None,
+                 **kwargs):
         super().__init__(*args, **kwargs)
         self.search_space = search_space
-        self.randomizer = Randomizer()
+        self.randomizer = Randomizer(seed)
+        self._sample_one = self.randomizer.sampler(self.search_space)
+        self._sample_n = self.randomizer.batch_sampler(self.search_space)
+        self._per_emit_count = per_emit_count
         self._ask_gen = self._ask()
 
     @property
     def per_emit_count(self):
-        warnings.warn("Per emit count not implemented.")
-        return 1
+        return self._per_emit_count
 
     def ask(self) -> Optional[List[Configuration]]:
         return next(self._ask_gen)
@@ -49,18 +55,13 @@ class RandomSearch(SearchAlgorithm):
 
         while True:
 
-            cfgs = []
+            count = self.per_emit_count
 
-            for _ in range(self.per_emit_count):
+            if count == 1:
+                yield [self._make_config(self._sample_one())]
+                continue
 
-                cfg = dict()
-
-                for p in self.search_space:
-                    cfg[p.name] = p.accept(self.randomizer)
-
-                cfgs.append(Configuration(cfg, requestor=self.name))
-
-            yield cfgs
+            yield [self._make_config(cfg) for cfg in self._sample_n(count)]
 
     def tell(self, config, result):
         # no needed
@@ -19,7 +19,6 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-from functools import partial
 from typing import List, Optional
 
 from gimeltune.models import Experiment
@@ -34,11 +33,9 @@ class SeedAlgorithm(SearchAlgorithm):
         self.is_emitted = False
 
     def ask(self) -> Optional[List[Configuration]]:
-        cf = partial(Configuration, requestor=self.name)
-
         if not self.is_emitted:
             self.is_emitted = True
-            return [cf(s) for s in self.seeds]
+            return [self._make_config(s) for s in self.seeds]
         else:
             return None
 
@@ -41,12 +41,24 @@ __all__ = ["SkoptBayesianAlgorithm"]
 
 
 class SkoptBayesianAlgorithm(SearchAlgorithm):
-    def __init__(self, search_space: SearchSpace, **kwargs):
+    def __init__(self,
+                 search_space: SearchSpace,
+                 base_estimator="GBRT",
+                 optimizer_kwargs: Optional[dict] = None,
+                 **kwargs):
+        """
+        :param search_space: search space.
+        :param base_estimator: surrogate model of `skopt.Optimizer`.
+        :param optimizer_kwargs: other `skopt.Optimizer` arguments,
+            e.g. `acq_optimizer_kwargs={"n_points": 1000}`.
+        """
 
         super().__init__(**kwargs)
 
         self.skopt_space = self._make_space(search_space)
-        self.optimizer_instance = skopt.Optimizer(self.skopt_space, "GBRT")
+        self.optimizer_instance = skopt.Optimizer(self.skopt_space,
+                                                  base_estimator,
+                                                  **(optimizer_kwargs or {}))
 
         self.ask_generator = self._ask()
 
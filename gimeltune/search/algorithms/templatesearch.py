@@ -1,4 +1,3 @@
-import copy
 from typing import List, Optional
 
 from gimeltune.models import Experiment
@@ -13,9 +12,17 @@ class TemplateSearchAlgorithm(SearchAlgorithm):
     def __init__(self, search_space: SearchSpace, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.search_space = search_space
+        self._params = tuple(search_space)
+        # Unit interval bounds of the primitive parameters are fixed,
+        # compute them once instead of on every step.
+        self._spans = {
+            p.name: self._unit_span(p)
+            for p in self._params if p.is_primitive()
+        }
         self.step_size = 0.1
         self._ask_gen = self._ask()
-        self.results = []
+        # (configuration, result) with the minimal result told so far.
+        self._best_so_far = None
 
     def ask(self) -> Optional[List[Configuration]]:
         return next(self._ask_gen)
@@ -24,60 +31,81 @@ class TemplateSearchAlgorithm(SearchAlgorithm):
 
         randomizer = Randomizer()
 
-        center = {p.name: p.accept(randomizer) for p in self.search_space}
+        center = {p.name: p.accept(randomizer) for p in self._params}
 
-        yield [Configuration(center, requestor=self.name)]
+        yield [self._make_config(center)]
 
-        def set_unit_value(p, config, uv):
-            low, high = p.low, p.high
+        def from_unit_value(p, value, uv):
+            low, high, span = self._spans[p.name]
 
-            if isinstance(p, Integer):
-                low -= 0.4999
-                high += 0.4999
-
-            if low < high:
-                val = uv * float(high - low) + low
+            if span > 0.0:
+                value = uv * span + low
 
                 if isinstance(p, Integer):
-                    val = round(val)
+                    value = round(value)
+
+                value = max(low, min(value, high))
 
-                val = max(low, min(val, high))
-                config[p.name] = val
+            return value
+
+        def unit_value_of(p, value):
+            low, _, span = self._spans[p.name]
+            return float(value - low) / span
 
         while True:
             points = list()
 
-            for param in self.search_space:
+            for param in self._params:
                 if param.is_primitive():
 
-                    unit_value = param.get_unit_value(center[param.name])
+                    value = center[param.name]
+                    unit_value = unit_value_of(param, value)
 
                     if unit_value > 0.0:
-                        down_cfg = copy.copy(center)
-                        set_unit_value(param, down_cfg,
-                                       min(1.0, unit_value - self.step_size))
-                        yield [Configuration(down_cfg, requestor=self.name)]
+                        down_cfg = {
+                            **center,
+                            param.name: from_unit_value(
+                                param, value,
+                                min(1.0, unit_value - self.step_size)),
+                        }
+                        yield [self._make_config(down_cfg)]
                         points.append(down_cfg)
 
                     if unit_value < 1.0:
-                        up_cfg = copy.copy(center)
-                        set_unit_value(param, up_cfg,
-                                       min(1.0, unit_value + self.step_size))
-                        yield [Configuration(up_cfg, requestor=self.name)]
+                        up_cfg = {
+                            **center,
+                            param.name: from_unit_value(
+                                param, value,
+                                min(1.0, unit_value + self.step_size)),
+                        }
+                        yield [self._make_config(up_cfg)]
                         points.append(up_cfg)
 
                 else:
-                    cfg = copy.copy(center)
-                    cfg[param.name] = param.accept(randomizer)
-                    yield [Configuration(cfg, requestor=self.name)]
+                    cfg = {**center, param.name: param.accept(randomizer)}
+                    yield [self._make_config(cfg)]
                     points.append(cfg)
 
-            minima = min(self.results, key=lambda x: x[1])
+            if self._best_so_far is None:
+                continue
+
+            minima, _ = self._best_so_far
 
-            if minima[0] != center:
-                center = copy.copy(minima[0])
+            if minima != center:
+                center = dict(minima)
             else:
                 self.step_size /= 2.0
 
+    @staticmethod
+    def _unit_span(p):
+        low, high = p.low, p.high
+
+        if isinstance(p, Integer):
+            low -= 0.4999
+            high += 0.4999
+
+        return low, high, float(high - low)
+
     def tell(self, config, result):
-        self.results.append((config, result))
+        if self._best_so_far is None or result < self._best_so_far[1]:
+            self._best_so_far = (config, result)
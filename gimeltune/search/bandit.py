@@ -1,8 +1,10 @@
 import logging
 
+import numpy as np
 from mab import algs
 
 from gimeltune.search.meta import MetaSearchAlgorithm
+from gimeltune.utils.results import improvements_mask
 
 log = logging.getLogger(__name__)
 
@@ -16,6 +18,8 @@ class UCB1(MetaSearchAlgorithm):
         self.mab = None
         self.name2index = dict()
         self.results = []
+        # Minimal told result, rewards are given for improving it.
+        self._best = None
         self.algo_select_count: int = algo_select_count
 
     def add_algorithm(self, algo):
@@ -45,19 +49,50 @@ class UCB1(MetaSearchAlgorithm):
     def tell(self, config, result):
         """Tell results to all search algorithms"""
 
-        if config.requestor in self.name2index:
-            algo_index = self.name2index[config.requestor]
-            has_reward = 1 if not self.results else int(result < min(self.results))
+        has_reward = self._best is None or result < self._best
 
-            if has_reward:
-                self.mab.reward(algo_index)
-                log.debug(f'Reward for {config.requestor} with result: {result}')
+        if has_reward and config.requestor in self.name2index:
+            self.mab.reward(self.name2index[config.requestor])
+            log.debug(f'Reward for {config.requestor} with result: {result}')
 
         self.results.append(result)
+        self._best = result if self._best is None else min(self._best, result)
 
         for algo in self.algorithms:
             algo.tell(config, result)
 
+    def tell_bulk(self, configs, results):
+        """Tell batch of results to all search algorithms"""
+
+        if not len(configs):
+            return
+
+        values = np.asarray(results, dtype=np.float64)
+        best = np.inf if self._best is None else self._best
+        rewards = improvements_mask(values, best)
+
+        if self._best is None:
+            rewards[0] = True
+
+        for i in np.flatnonzero(rewards):
+            config = configs[i]
+
+            if config.requestor in self.name2index:
+                self.mab.reward(self.name2index[config.requestor])
+                log.debug(f'Reward for {config.requestor} '
+                          f'with result: {results[i]}')
+
+        self.results.extend(results)
+        self._best = float(np.fmin.reduce(values, initial=best))
+
+        for algo in self.algorithms:
+            if isinstance(algo, MetaSearchAlgorithm):
+                algo.tell_bulk(configs, results)
+                continue
+
+            for config, result in zip(configs, results):
+                algo.tell(config, result)
+
 
 class UCBTuned(UCB1):
     STRATEGY = algs.UCBTuned
@@ -14,6 +14,8 @@ class MetaSearchAlgorithm(SearchAlgorithm):
         super().__init__(*algorithms, **kwargs)
         self.algorithms = list(algorithms)
         self.req_count = 0
+        # Executor for concurrent asks, it's set by `Job.do(parallel=True)`.
+        self.executor = None
         self.ask_gen = self._ask()
 
     def ask(self) -> Optional[List[Configuration]]:
@@ -22,20 +24,60 @@ class MetaSearchAlgorithm(SearchAlgorithm):
     def _ask(self) -> Generator:
         prev_picked = ''
         while True:
-            for algo in self.order:
+            order = list(self.order)
+            prefetched = self._prefetch(order)
+
+            for algo in order:
                 if not prev_picked or prev_picked != algo.name:
                     log.debug(f'Pick {algo.name}')
-                configs = algo.ask()
+                configs = (prefetched.pop(id(algo))
+                           if id(algo) in prefetched else algo.ask())
                 yield configs
                 self.req_count += 1 if configs is not None else 0
                 prev_picked = algo.name
 
+    def _prefetch(self, order):
+        """
+        Ask algorithms of the round concurrently if executor is set.
+        Meta algorithms may share children, so they are asked in turn.
+
+        :param order: algorithms of the round.
+        :return: configurations by algorithm's id.
+        """
+
+        if self.executor is None:
+            return {}
+
+        algorithms = {id(algo): algo for algo in order
+                      if not isinstance(algo, MetaSearchAlgorithm)}
+
+        if len(algorithms) < 2:
+            return {}
+
+        futures = {key: self.executor.submit(algo.ask)
+                   for key, algo in algorithms.items()}
+
+        # All asks are completed before any results are told.
+        return {key: future.result() for key, future in futures.items()}
+
     def tell(self, config, result):
         """Tell results to all search algorithms"""
 
         for algo in self.algorithms:
             algo.tell(config, result)
 
+    def tell_bulk(self, configs, results):
+        """
+        Tell batch of results to all search algorithms.
+
+        :param configs: told configurations.
+        :param results: results in the same order as configurations.
+        :return: None
+        """
+
+        for config, result in zip(configs, results):
+            self.tell(config, result)
+
     def add_algorithm(self, algo: SearchAlgorithm):
         """
         Append algorithm to algorithms list.
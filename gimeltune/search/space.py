@@ -19,14 +19,25 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import operator
 import warnings
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
 import yaml
 
-from gimeltune.search.parameters import Categorical, Integer, Parameter, Real
+from gimeltune.search.parameters import (
+    Categorical,
+    Integer,
+    Parameter,
+    ParametersVisitor,
+    Real,
+)
 
-__all__ = ["SearchSpace"]
+__all__ = ["SearchSpace", "REAL", "INTEGER", "CATEGORICAL"]
+
+# Kinds of parameters in `SearchSpace.kinds`.
+REAL, INTEGER, CATEGORICAL = 0, 1, 2
 
 
 class SearchSpace:
@@ -34,11 +45,14 @@ class SearchSpace:
     def __init__(self, *parameters):
         self.params: List[Parameter] = parameters or list()
         self.name2param = {p.name: p for p in parameters} or dict()
+        # (kinds, lows, highs) arrays, built on first use.
+        self._encoded = None
 
     def insert(self, p: Parameter) -> None:
         # TODO (qnbhd): make duplication check
         self.params.append(p)
         self.name2param[p.name] = p
+        self._encoded = None
 
     def get(self, item: str, default=None):
         return self.name2param.get(item, default)
@@ -60,6 +74,66 @@ class SearchSpace:
     def __len__(self):
         return len(self.params)
 
+    def _encoding(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._encoded is None:
+            encoder = _Encoder()
+            rows = [p.accept(encoder) for p in self.params]
+            kinds, lows, highs = zip(*rows) if rows else ((), (), ())
+
+            self._encoded = (
+                np.array(kinds, dtype=np.uint8),
+                np.array(lows, dtype=float),
+                np.array(highs, dtype=float),
+            )
+
+        return self._encoded
+
+    @property
+    def kinds(self) -> np.ndarray:
+        """Kinds of parameters: REAL, INTEGER or CATEGORICAL."""
+        return self._encoding()[0]
+
+    @property
+    def lows(self) -> np.ndarray:
+        """Low bounds of parameters, 0 for categorical ones."""
+        return self._encoding()[1]
+
+    @property
+    def highs(self) -> np.ndarray:
+        """High bounds of parameters, last choice index for categorical."""
+        return self._encoding()[2]
+
+    def sample(self, n: int, rng) -> np.ndarray:
+        """
+        Sample points uniformly within parameters bounds.
+
+        :param n: count of points.
+        :param rng: numpy random generator (or RandomState).
+        :return: array of shape (n, parameters count).
+        """
+
+        _, lows, highs = self._encoding()
+        return rng.uniform(lows, highs, size=(n, len(lows)))
+
+    def getter(self, *names: str):
+        """
+        Build a getter of parameters values from a configuration,
+        e.g. `x, y = space.getter("x", "y")(experiment.params)`.
+
+        :param names: names of parameters to get.
+        :return: callable returning a value for a single name
+         and a tuple of values otherwise.
+        """
+
+        if not names:
+            raise ValueError("At least one parameter name is required.")
+
+        for name in names:
+            if name not in self.name2param:
+                raise KeyError(f"Unknown parameter: {name}")
+
+        return operator.itemgetter(*names)
+
     @classmethod
     def from_yaml(cls, yaml_string):
         """Load search space from yaml file."""
@@ -80,6 +154,17 @@ class SearchSpace:
             return cls.from_yaml(f.read())
 
 
+class _Encoder(ParametersVisitor):
+    def visit_integer(self, p: Integer):
+        return INTEGER, p.low, p.high
+
+    def visit_real(self, p: Real):
+        return REAL, p.low, p.high
+
+    def visit_categorical(self, p: Categorical):
+        return CATEGORICAL, 0, len(p.choices) - 1
+
+
 def parameter_factory(**kwargs):
     param_signature = kwargs["signature"]
 
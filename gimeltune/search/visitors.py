@@ -1,14 +1,153 @@
 import random
+from typing import Callable, Dict, Iterable, List
 
-from gimeltune.search.parameters import ParametersVisitor
+import numpy as np
+
+from gimeltune.search.parameters import Parameter, ParametersVisitor
 
 
 class Randomizer(ParametersVisitor):
+    def __init__(self, seed=None):
+        """
+        :param seed: seed of random draws, if None draws are
+            controlled by `random` module state (e.g. `random.seed`).
+        """
+
+        self.random = random if seed is None else random.Random(seed)
+        self._rng = None
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """NumPy generator of vectorized draws, seeded by `random`."""
+
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.random.getrandbits(64))
+
+        return self._rng
+
+    def visit_integer(self, p):
+        return self.random.randint(p.low, p.high)
+
+    def visit_real(self, p):
+        return (p.high - p.low) * self.random.random() + p.low
+
+    def visit_categorical(self, p):
+        return self.random.choice(p.choices)
+
+    def sampler(self, params: Iterable[Parameter]) -> Callable[[], Dict]:
+        """
+        Make function which samples one configuration.
+
+        Per-parameter samplers are built once, so calls skip
+        the visitor double dispatch.
+
+        :param params: parameters to sample.
+        :return: function returning configuration dict.
+        """
+
+        params = list(params)
+        names = tuple(p.name for p in params)
+        maker = _ScalarSamplerMaker(self.random)
+        samplers = tuple(p.accept(maker) for p in params)
+
+        def sample_one():
+            return {name: f() for name, f in zip(names, samplers)}
+
+        return sample_one
+
+    def batch_sampler(
+            self, params: Iterable[Parameter]) -> Callable[[int], List[Dict]]:
+        """
+        Make function which samples `n` configurations.
+
+        Bounds are collected once, then each kind of parameters
+        takes one vectorized draw of shape (n, params count).
+
+        :param params: parameters to sample.
+        :return: function returning list of configuration dicts.
+        """
+
+        params = list(params)
+        names = tuple(p.name for p in params)
+        bounds = _BoundsCollector()
+
+        for p in params:
+            p.accept(bounds)
+
+        reals_low = np.array(bounds.reals_low, dtype=float)
+        reals_high = np.array(bounds.reals_high, dtype=float)
+        ints_low = np.array(bounds.ints_low, dtype=np.int64)
+        # Upper bounds are exclusive for `integers`.
+        ints_high = np.array(bounds.ints_high, dtype=np.int64) + 1
+        sizes = np.array([len(c) for c in bounds.choices], dtype=np.int64)
+
+        def sample_n(n):
+            if not names:
+                return [{} for _ in range(n)]
+
+            rng = self.rng
+            columns = {}
+
+            if bounds.reals:
+                values = rng.uniform(reals_low, reals_high,
+                                     size=(n, len(bounds.reals)))
+                columns.update(zip(bounds.reals, values.T.tolist()))
+
+            if bounds.ints:
+                values = rng.integers(ints_low, ints_high,
+                                      size=(n, len(bounds.ints)))
+                columns.update(zip(bounds.ints, values.T.tolist()))
+
+            if bounds.categoricals:
+                # Choices are taken by index to keep their python types,
+                # NumPy would coerce mixed choices (e.g. str and None).
+                indexes = rng.integers(sizes, size=(n, len(sizes)))
+                columns.update(
+                    (name, [choices[i] for i in column])
+                    for name, choices, column in zip(
+                        bounds.categoricals, bounds.choices, indexes.T))
+
+            return [dict(zip(names, row))
+                    for row in zip(*(columns[name] for name in names))]
+
+        return sample_n
+
+
+class _ScalarSamplerMaker(ParametersVisitor):
+    def __init__(self, source):
+        self.randint = source.randint
+        self.random = source.random
+        self.choice = source.choice
+
+    def visit_integer(self, p):
+        low, high, randint = p.low, p.high, self.randint
+        return lambda: randint(low, high)
+
+    def visit_real(self, p):
+        low, span, uniform = p.low, p.high - p.low, self.random
+        return lambda: span * uniform() + low
+
+    def visit_categorical(self, p):
+        choices, choice = p.choices, self.choice
+        return lambda: choice(choices)
+
+
+class _BoundsCollector(ParametersVisitor):
+    def __init__(self):
+        self.reals, self.reals_low, self.reals_high = [], [], []
+        self.ints, self.ints_low, self.ints_high = [], [], []
+        self.categoricals, self.choices = [], []
+
     def visit_integer(self, p):
-        return random.randint(p.low, p.high)
+        self.ints.append(p.name)
+        self.ints_low.append(p.low)
+        self.ints_high.append(p.high)
 
     def visit_real(self, p):
-        return (p.high - p.low) * random.random() + p.low
+        self.reals.append(p.name)
+        self.reals_low.append(p.low)
+        self.reals_high.append(p.high)
 
     def visit_categorical(self, p):
-        return random.choice(p.choices)
+        self.categoricals.append(p.name)
+        self.choices.append(p.choices)
@@ -1,4 +1,5 @@
 """Storages module."""
 
+from .memory import MemoryStorage
 from .storage import Storage
 from .tiny import TinyDBStorage
@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2021 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import heapq
+from typing import Dict, List, Optional
+
+from gimeltune.exceptions import InsertExperimentWithTheExistedId
+from gimeltune.models import Experiment
+from gimeltune.storages.storage import Storage
+
+__all__ = ["MemoryStorage"]
+
+
+class MemoryStorage(Storage):
+    """
+    Dict-backed storage which keeps everything in process memory.
+    Nothing is persisted, use it for tests and throwaway jobs.
+    """
+
+    __version__ = "0.1.0"
+
+    def __init__(self):
+        self._jobs: Dict[str, int] = dict()
+        # job id -> experiment id -> experiment
+        self._experiments: Dict[int, Dict[int, Experiment]] = dict()
+
+    def insert_job(self, job):
+        self._jobs.setdefault(job.name, job.id)
+
+    def is_job_name_exists(self, name):
+        return name in self._jobs
+
+    def get_job_id_by_name(self, name) -> Optional[int]:
+        return self._jobs.get(name)
+
+    def insert_experiment(self, experiment):
+        self.insert_experiments([experiment])
+
+    def insert_experiments(self, experiments):
+        for experiment in experiments:
+            stored = self._experiments.setdefault(experiment.job_id, dict())
+
+            if experiment.id in stored:
+                raise InsertExperimentWithTheExistedId()
+
+            stored[experiment.id] = experiment.copy(deep=True)
+
+    # Stored experiments are copied on the way out too, like other
+    # storages return fresh objects, so callers can't change them.
+    def get_experiment(self, job_id, experiment_id):
+        experiment = self._experiments.get(job_id, {}).get(experiment_id)
+        return experiment.copy(deep=True) if experiment else None
+
+    def get_experiments_by_job_id(self, job_id) -> List[Experiment]:
+        stored = self._experiments.get(job_id, {})
+        return [stored[i].copy(deep=True) for i in sorted(stored)]
+
+    def get_experiments_count(self, job) -> int:
+        return len(self._experiments.get(job, {}))
+
+    def get_objective_results(self, job_id) -> List[float]:
+        stored = self._experiments.get(job_id, {})
+        return [stored[i].objective_result for i in sorted(stored)]
+
+    def best_experiment(self, job) -> Optional[Experiment]:
+        experiments = self.top_experiments(job, 1)
+        return experiments[0] if experiments else None
+
+    def top_experiments(self, job_id, n) -> List[Experiment]:
+        experiments = (e for e in self._experiments.get(job_id, {}).values()
+                       if e.objective_result is not None)
+        top = heapq.nsmallest(n, experiments,
+                              key=lambda e: (e.objective_result, e.id))
+        return [e.copy(deep=True) for e in top]
+
+    @property
+    def jobs(self):
+        return [{"id": job_id, "name": name}
+                for name, job_id in self._jobs.items()]
+
+    @property
+    def version(self):
+        return self.__version__
@@ -1,9 +1,10 @@
-import json
-
-from sqlalchemy import Column, Float, ForeignKey, Integer, String, TypeDecorator, types
+from sqlalchemy import (Column, Float, ForeignKey, Index, Integer, String,
+                        TypeDecorator, types)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from gimeltune.utils import serialization
+
 _Base = declarative_base()
 
 
@@ -15,14 +16,14 @@ class Json(TypeDecorator):
     impl = types.String
 
     def process_bind_param(self, value, dialect):
-        return json.dumps(value)
+        return serialization.dumps(value).decode()
 
     def process_literal_param(self, value, dialect):
         return value
 
     def process_result_value(self, value, dialect):
         try:
-            return json.loads(value)
+            return serialization.loads(value)
         except (ValueError, TypeError):
             return None
 
@@ -31,7 +32,7 @@ class JobModel(_Base):
     __tablename__ = "jobs"
 
     id = Column(Integer, primary_key=True)
-    name = Column(String)
+    name = Column(String, unique=True, index=True)
 
     def __repr__(self):
         return f"Job<{self.id}, {self.name}"
@@ -39,6 +40,11 @@ class JobModel(_Base):
 
 class ExperimentModel(_Base):
     __tablename__ = "experiments"
+    __table_args__ = (
+        # Leading `job_id` column also serves plain `job_id` filters,
+        # so separate single-column index is not needed.
+        Index("ix_experiments_job_obj", "job_id", "objective_result"),
+    )
 
     id = Column(Integer, primary_key=True)
     job_id = Column(ForeignKey(JobModel.id), primary_key=True)
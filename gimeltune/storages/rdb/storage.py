@@ -1,6 +1,8 @@
 from typing import List, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from gimeltune.models import Experiment
@@ -8,18 +10,95 @@ from gimeltune.models.configuration import Configuration
 from gimeltune.storages.rdb.models import ExperimentModel, JobModel, _Base
 from gimeltune.storages.storage import Storage
 
+_jobs = JobModel.__table__
+_experiments = ExperimentModel.__table__
+
+DEFAULT_POOL_SIZE = 8
+
+
+def _engine_options(url, pool_size: Optional[int] = None) -> dict:
+    if make_url(url).get_backend_name() == "sqlite":
+        # SQLite connections are cheap and local, the dialect picks its
+        # own pool (a single shared connection for in-memory databases).
+        return dict()
+
+    pool_size = pool_size or DEFAULT_POOL_SIZE
+
+    return dict(
+        pool_size=pool_size,
+        max_overflow=2 * pool_size,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+
+def _is_sqlite_file(url) -> bool:
+    url = make_url(url)
+    return (url.get_backend_name() == "sqlite"
+            and url.database not in (None, "", ":memory:"))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL appends pages instead of rewriting the database file, and
+    # it's safe to skip fsync on every commit with it.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _experiment_from_row(row) -> Experiment:
+    fields = dict(row)
+    fields["params"] = Configuration(fields["params"],
+                                     requestor=fields.pop("requestor"))
+    return Experiment(**fields)
+
+
+def _experiment_to_row(experiment) -> dict:
+    return {
+        "id": experiment.id,
+        "job_id": experiment.job_id,
+        "state": experiment.state,
+        "hash": experiment.hash,
+        "objective_result": experiment.objective_result,
+        "params": experiment.params,
+        "requestor": experiment.params.requestor,
+        "create_timestamp": experiment.create_timestamp,
+        "finish_timestamp": experiment.finish_timestamp,
+        "metrics": experiment.metrics,
+    }
+
 
 class RDBStorage(Storage):
-    def __init__(self, url):
-        self.engine = create_engine(url)
+    def __init__(self, url, pool_size: Optional[int] = None):
+        self.engine = create_engine(url, **_engine_options(url, pool_size))
+
+        if _is_sqlite_file(url):
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+
         _Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
         self.Session = sessionmaker(bind=self.engine)
         self.session = self.Session()
 
+    def _create_missing_indexes(self):
+        # `create_all` skips tables that already exist, so
+        # storages created by older versions do not get new indexes.
+        for table in _Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
     def insert_job(self, job):
-        job_model = JobModel(id=job.id, name=job.name)
-        self.session.add(job_model)
-        self.session.commit()
+        try:
+            self.session.execute(insert(_jobs).values(id=job.id,
+                                                      name=job.name))
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+
+            # Job is already stored (e.g. on `load_job`), names are unique.
+            if self.get_job_id_by_name(job.name) != job.id:
+                raise
 
     def is_job_name_exists(self, name):
         job_model = self.session.query(JobModel).filter_by(name=name).first()
@@ -30,39 +109,55 @@ class RDBStorage(Storage):
         return job_model.id if job_model else None
 
     def insert_experiment(self, experiment):
-        experiment_model = ExperimentModel(
-            id=experiment.id,
-            job_id=experiment.job_id,
-            state=experiment.state,
-            hash=experiment.hash,
-            objective_result=experiment.objective_result,
-            params=experiment.params,
-            requestor=experiment.params.requestor,
-            create_timestamp=experiment.create_timestamp,
-            finish_timestamp=experiment.finish_timestamp,
-            metrics=experiment.metrics,
-        )
-        self.session.add(experiment_model)
+        self.insert_experiments([experiment])
+
+    def insert_experiments(self, experiments):
+        if not experiments:
+            return
+
+        # One executemany and one commit for the whole batch.
+        self.session.execute(insert(_experiments),
+                             [_experiment_to_row(e) for e in experiments])
         self.session.commit()
 
+    def _select_experiments(self, job_id):
+        # Core selects skip ORM hydration and identity map bookkeeping.
+        return select(_experiments).where(_experiments.c.job_id == job_id)
+
+    def _fetch_experiments(self, query) -> List[Experiment]:
+        rows = self.session.execute(query).mappings()
+        return [_experiment_from_row(row) for row in rows]
+
     def get_experiment(self, job_id, experiment_id):
-        experiment_model = (self.session.query(ExperimentModel).filter_by(
-            id=experiment_id, job_id=job_id).one())
-        return Experiment.from_orm(experiment_model)
+        query = self._select_experiments(job_id).where(
+            _experiments.c.id == experiment_id)
+        return _experiment_from_row(
+            self.session.execute(query).mappings().one())
 
     def get_experiments_by_job_id(self, job_id) -> List[Experiment]:
-        experiments_models = (self.session.query(ExperimentModel).filter_by(
-            job_id=job_id).all())
-        experiments = []
-        for exp in experiments_models:
-            exp.params = Configuration(exp.params, requestor=exp.requestor)
-            experiments.append(Experiment.from_orm(exp))
-        return experiments
+        query = self._select_experiments(job_id).order_by(_experiments.c.id)
+        return self._fetch_experiments(query)
 
     def get_experiments_count(self, job_id) -> int:
-        experiments_models = (self.session.query(ExperimentModel).filter_by(
-            job_id=job_id).all())
-        return len(experiments_models)
+        query = (select(func.count()).select_from(_experiments).where(
+            _experiments.c.job_id == job_id))
+        return self.session.execute(query).scalar()
+
+    def get_objective_results(self, job_id) -> List[float]:
+        query = (select(_experiments.c.objective_result).where(
+            _experiments.c.job_id == job_id).order_by(_experiments.c.id))
+        return self.session.execute(query).scalars().all()
+
+    def best_experiment(self, job) -> Optional[Experiment]:
+        experiments = self.top_experiments(job, 1)
+        return experiments[0] if experiments else None
+
+    def top_experiments(self, job_id, n) -> List[Experiment]:
+        query = (self._select_experiments(job_id).where(
+            _experiments.c.objective_result.is_not(None)).order_by(
+                _experiments.c.objective_result,
+                _experiments.c.id).limit(n))
+        return self._fetch_experiments(query)
 
     @property
     def jobs(self):
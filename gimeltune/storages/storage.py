@@ -30,6 +30,8 @@ __all__ = ["Storage"]
 class Storage(metaclass=abc.ABCMeta):
     def insert_job(self, job):
         """
+        Insert job. Nothing is done if
+        job with the same name is already stored.
 
         :param job:
         :return:
@@ -67,6 +69,18 @@ class Storage(metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def insert_experiments(self, experiments):
+        """
+        Insert experiments batch. Storages which can
+        write a batch at once should override it.
+
+        :param experiments: list of experiments.
+        :return:
+        """
+
+        for experiment in experiments:
+            self.insert_experiment(experiment)
+
     @abc.abstractmethod
     def get_experiment(self, job_id, experiment_id):
         """
@@ -98,6 +112,18 @@ class Storage(metaclass=abc.ABCMeta):
 
         pass
 
+    def get_objective_results(self, job_id) -> List[float]:
+        """
+        Get objective results of job experiments ordered by id.
+
+        :param job_id:
+        :return:
+        """
+
+        experiments = self.get_experiments_by_job_id(job_id)
+        experiments.sort(key=lambda x: x.id)
+        return [e.objective_result for e in experiments]
+
     def best_experiment(self, job) -> Optional[Experiment]:
         """
 
@@ -56,6 +56,9 @@ class TinyDBStorage(Storage):
         self.experiments_table = self.tiny_db.table("experiment")
 
     def insert_job(self, job):
+        if self.is_job_name_exists(job.name):
+            return
+
         doc = {
             "name": job.name,
             "id": job.id,
@@ -79,14 +82,28 @@ class TinyDBStorage(Storage):
         return len(jobs) != 0
 
     def insert_experiment(self, experiment):
-        doc = experiment.dict()
-        doc['requestor'] = experiment.params.requestor
+        self.insert_experiments([experiment])
+
+    def insert_experiments(self, experiments):
+        docs = []
+        ids = set()
+
+        for experiment in experiments:
+            key = (experiment.job_id, experiment.id)
 
-        if self.get_experiment(experiment.job_id, experiment.id):
-            # TODO (qnbhd): make correct exception
-            raise InsertExperimentWithTheExistedId()
+            if key in ids or self.get_experiment(*key):
+                # TODO (qnbhd): make correct exception
+                raise InsertExperimentWithTheExistedId()
 
-        self.experiments_table.insert(doc)
+            ids.add(key)
+
+            doc = experiment.dict()
+            doc['requestor'] = experiment.params.requestor
+            docs.append(doc)
+
+        # TinyDB rewrites the whole file on every write,
+        # so the batch is written at once.
+        self.experiments_table.insert_multiple(docs)
 
     def get_experiment(self, job_id, experiment_id):
         q = self.experiments_table.search((Query().id == experiment_id)
@@ -115,6 +132,10 @@ class TinyDBStorage(Storage):
             experiments.append(exp)
         return experiments
 
+    def get_objective_results(self, job_id) -> List[float]:
+        docs = sorted(self._get_raw_experiments(job_id), key=lambda d: d['id'])
+        return [doc['objective_result'] for doc in docs]
+
     def get_experiments_count(self, job) -> int:
         return len(self.get_experiments_by_job_id(job))
 
@@ -0,0 +1,38 @@
+# MIT License
+#
+# Copyright (c) 2021 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for sequences of objective results."""
+import numpy as np
+
+
+def improvements_mask(values, best=np.inf) -> np.ndarray:
+    """
+    Mask of values which are strictly less than all previous ones.
+
+    :param values: objective results in order they are told.
+    :param best: best result before the first of values.
+    :return: boolean array of values shape.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    # `fmin` skips NaN results, like comparisons in a plain loop do.
+    previous = np.fmin.accumulate(np.concatenate(([best], values)))[:-1]
+    return values < previous
@@ -12,6 +12,7 @@ def cleanup():
     init(verbose=True)
     yield
     for f in chain(glob.glob("*.json"), glob.glob("*.yaml"),
-                   glob.glob("*.db")):
+                   glob.glob("*.db"), glob.glob("*.db-wal"),
+                   glob.glob("*.db-shm")):
         os.remove(f)
 
@@ -1,6 +1,17 @@
+import numpy as np
+from sklearn.ensemble import AdaBoostRegressor, RandomForestRegressor
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import Matern
+from sklearn.neural_network import MLPRegressor
+
 from gimeltune import Categorical, Integer, Real, SearchSpace, create_job
 from gimeltune.models import Result
 from gimeltune.search.algorithms import BayesianAlgorithm
+from gimeltune.search.algorithms.bayesian import (
+    IncrementalGaussianProcessRegressor,
+    _ei_loop,
+    _ei_numpy,
+)
 
 
 def test_bayesian_search():
@@ -52,3 +63,170 @@ def test_specify_acq_bayesian_search():
                               acq_function='ucb')
 
     job.do(objective, n_trials=10, algo_list=[a_ucb])
+
+
+def test_bayesian_warm_start(monkeypatch):
+    space = SearchSpace()
+
+    space.insert(Real("x", low=0.0, high=1.0))
+    space.insert(Real("y", low=0.0, high=1.0))
+
+    def objective(experiment):
+        return experiment.params["x"] + experiment.params["y"]
+
+    mlp = BayesianAlgorithm(search_space=space,
+                            regressor=MLPRegressor,
+                            warm_start=True)
+    forest = BayesianAlgorithm(search_space=space,
+                               regressor=RandomForestRegressor,
+                               warm_start=True)
+
+    assert mlp.model.warm_start
+    assert forest.model.warm_start
+    assert not BayesianAlgorithm(search_space=space,
+                                 regressor=AdaBoostRegressor,
+                                 warm_start=True).model.get_params().get(
+                                     "warm_start", False)
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=10, algo_list=[mlp])
+
+    mlp.ask()
+    assert mlp._fitted_count == len(mlp.y) == 10
+
+    # no new observations, no refit
+    monkeypatch.setattr(mlp.model, "fit", None)
+    mlp.ask()
+
+
+def test_bayesian_forest_warm_start():
+    space = SearchSpace()
+
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    forest = BayesianAlgorithm(
+        search_space=space,
+        regressor=lambda: RandomForestRegressor(n_estimators=25),
+        warm_start=True,
+    )
+
+    sizes = []
+
+    for i in range(6):
+        forest.tell({"x": i / 10}, float(i))
+        forest._fit()
+        sizes.append(len(forest.model.estimators_))
+
+    assert sizes == [10, 20, 25, 25, 25, 25]
+    # the newest trees are fitted on all observations
+    assert forest.model.estimators_[-1].tree_.weighted_n_node_samples[0] == 6
+
+
+def test_expected_improvement_kernels():
+    rng = np.random.default_rng(0)
+
+    mean = rng.normal(size=100)
+    std = rng.uniform(0.1, 1.0, size=100)
+
+    assert np.allclose(_ei_loop(mean, std, 0.5, 0.1),
+                       _ei_numpy(mean, std, 0.5, 0.1))
+
+
+def test_bayesian_mc_acquisition():
+    space = SearchSpace()
+
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    forest = BayesianAlgorithm(search_space=space,
+                               regressor=RandomForestRegressor)
+
+    job = create_job(search_space=space)
+    job.do(lambda e: e.params["x"], n_trials=8, algo_list=[forest])
+
+    yhat = forest.model.predict(forest.X)
+    scores = forest.acquisition(np.linspace(0.0, 1.0, 5).reshape(-1, 1))
+
+    assert forest.acq_function == "mc"
+    assert np.array_equal(scores, [max(0, min(yhat) - y) for y in yhat])
+
+
+def test_bayesian_observations_buffer():
+    space = SearchSpace()
+
+    space.insert(Integer("x", low=0, high=100))
+    space.insert(Categorical("z", choices=["foo", "bar"]))
+
+    algo = BayesianAlgorithm(search_space=space)
+
+    for i in range(40):
+        algo.tell({"x": i, "z": ["foo", "bar"][i % 2]}, float(-i))
+
+    assert algo.X.shape == (40, 2)
+    assert np.array_equal(algo.X[:, 0], np.arange(40))
+    assert np.array_equal(algo.X[:, 1], np.arange(40) % 2)
+    assert np.array_equal(algo.y, -np.arange(40))
+
+
+def test_incremental_gaussian_process(monkeypatch):
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(30, 3))
+    y = np.sin(X).sum(axis=1)
+    X_test = rng.uniform(size=(10, 3))
+
+    for normalize_y in (False, True):
+        params = dict(kernel=Matern(nu=2.5), alpha=1e-6,
+                      normalize_y=normalize_y)
+
+        incremental = IncrementalGaussianProcessRegressor(**params)
+        incremental.fit(X[:10], y[:10])
+
+        full_fits = []
+        full_fit = GaussianProcessRegressor.fit
+
+        def counted_fit(self, *args):
+            full_fits.append(len(args[0]))
+            return full_fit(self, *args)
+
+        monkeypatch.setattr(GaussianProcessRegressor, "fit", counted_fit)
+
+        for n in (11, 20, 30):
+            incremental.fit(X[:n], y[:n])
+
+        monkeypatch.undo()
+
+        # Factor is extended, not recomputed.
+        assert full_fits == []
+
+        full = GaussianProcessRegressor(optimizer=None, **params).fit(X, y)
+
+        assert np.allclose(incremental.L_, full.L_)
+        assert np.allclose(incremental.log_marginal_likelihood_value_,
+                           full.log_marginal_likelihood_value_)
+
+        for a, b in zip(incremental.predict(X_test, return_std=True),
+                        full.predict(X_test, return_std=True)):
+            assert np.allclose(a, b)
+
+    # Not appended observations lead to full refit.
+    incremental.fit(X[5:], y[5:])
+
+    assert np.allclose(
+        incremental.L_,
+        GaussianProcessRegressor(optimizer=None, **params).fit(X[5:],
+                                                               y[5:]).L_,
+    )
+
+
+def test_bayesian_incremental_gaussian_process():
+    space = SearchSpace()
+
+    space.insert(Real("x", low=-5.0, high=5.0))
+
+    algo = BayesianAlgorithm(search_space=space,
+                             regressor=IncrementalGaussianProcessRegressor)
+    job = create_job(search_space=space, storage="memory://")
+    job.do(lambda e: e.params["x"]**2, n_trials=15, algo_list=[algo])
+
+    assert algo.acq_function == "ei"
+    assert len(algo.model.X_train_) == len(algo.y) - 1
+    assert job.best_value < 1.0
@@ -1,7 +1,10 @@
+import copy
 import hashlib
 import json
+import pickle
 
 from gimeltune import Experiment
+from gimeltune.models.configuration import Configuration
 from gimeltune.models.experiment import ExperimentState
 
 
@@ -68,3 +71,11 @@ def test_experiment():
 
     ex2.error_finish()
     assert ex2.finish_timestamp
+
+
+def test_configuration_pickling():
+    cfg = Configuration({"x": 0.0, "y": 1.0}, requestor="foo")
+
+    for restored in (pickle.loads(pickle.dumps(cfg)), copy.deepcopy(cfg)):
+        assert restored == cfg
+        assert restored.requestor == "foo"
@@ -1,12 +1,17 @@
+import time
+from enum import Enum
 from typing import List, Optional
 
+import numpy as np
 import pytest
 
 from gimeltune import (
     Experiment,
+    Integer,
     Real,
     SearchAlgorithm,
     SearchSpace,
+    SeedAlgorithm,
     TinyDBStorage,
     create_job,
     load_job,
@@ -76,10 +81,149 @@ def test_create_load_job():
     assert isinstance(job2.experiments, list) and len(job2.experiments) == 10
     assert job2.experiments_count == 10
     assert len(job2.top_experiments(100)) == 10
+    assert job2.rewards == job.rewards
 
     print(job2.get_dataframe(desc=True))
 
 
+def test_dataframe():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    seeds = [{"x": x} for x in [3.0, 5.0, 2.0, 2.0, 1.0]]
+
+    job = create_job(search_space=space)
+    job.do(lambda e: e.params["x"], algo_list=[SeedAlgorithm(*seeds)])
+
+    df = job.dataframe
+
+    assert list(df.columns) == [
+        "state", "objective_result", "create_time", "finish_time", "param_x"
+    ]
+    assert list(df.index) == [0, 1, 2, 3, 4]
+
+    brief = job.get_dataframe(brief=True, desc=True)
+
+    assert list(brief.columns) == ["objective_result", "param_x"]
+    assert list(brief.index) == [0, 2, 4]
+    assert list(brief["objective_result"]) == [3.0, 2.0, 1.0]
+    assert job.rewards == 3
+
+
+def test_evaluated_configurations_skipped():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    def seeds(*xs):
+        return SeedAlgorithm(*[{"x": x} for x in xs])
+
+    job = create_job(search_space=space)
+    job.do(lambda e: e.params["x"], algo_list=[seeds(1.0, 2.0)],
+           memoize=True)
+    job.do(lambda e: e.params["x"], algo_list=[seeds(2.0, 3.0, 1.0)],
+           memoize=True)
+
+    assert [e.params["x"] for e in job.experiments] == [1.0, 2.0, 3.0]
+
+
+def _spawned_objective(experiment):
+    return experiment.params["x"] * 10 + experiment.params["z"]
+
+
+def test_spawned_workers():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+    space.insert(Integer("z", low=0, high=100))
+
+    job = create_job(search_space=space)
+    job.do(_spawned_objective, n_trials=4, n_proc=2, algo_list=["random"],
+           start_method="spawn")
+
+    assert job.experiments_count == 4
+
+    # Results arriving out of order are applied to their configurations.
+    for e in job.experiments:
+        assert e.objective_result == _spawned_objective(e)
+
+
+def test_memoization_cache_filled_on_demand():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    job = create_job(search_space=space)
+    job.do(lambda e: e.params["x"],
+           algo_list=[SeedAlgorithm({"x": 1.0}, {"x": 2.0})])
+
+    # Nothing is cached without memoization.
+    assert job._obj_cache is None
+
+    job.do(lambda e: e.params["x"],
+           algo_list=[SeedAlgorithm({"x": 2.0}, {"x": 3.0})], memoize=True)
+
+    assert [e.params["x"] for e in job.experiments] == [1.0, 2.0, 3.0]
+    assert len(job._obj_cache) == 3
+
+
+def test_repeats_within_batch_evaluated_once():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    job = create_job(search_space=space)
+    job.do(lambda e: time.perf_counter(), n_trials=3, batch=3, memoize=True,
+           algo_list=[SeedAlgorithm({"x": 1.0}, {"x": 2.0}, {"x": 1.0})])
+
+    first, other, repeat = job.experiments
+
+    assert repeat.params == first.params
+    assert repeat.objective_result == first.objective_result
+    assert other.objective_result != first.objective_result
+
+
+def test_exhausted_space_not_replayed():
+    space = SearchSpace()
+    space.insert(Integer("x", low=0, high=3))
+
+    job = create_job(search_space=space)
+
+    with pytest.warns(UserWarning, match="No new configurations"):
+        job.do(lambda e: e.params["x"], n_trials=50, algo_list=["random"],
+               memoize=True)
+
+    xs = [e.params["x"] for e in job.experiments]
+
+    assert 0 < job.experiments_count == len(xs) <= 4
+    assert len(set(xs)) == len(xs)
+
+
+def test_evaluated_configurations_repeated_by_default():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    job = create_job(search_space=space)
+    # Noisy objective, its results are not reused.
+    job.do(lambda e: time.perf_counter(),
+           algo_list=[SeedAlgorithm({"x": 1.0}, {"x": 1.0})])
+
+    first, second = job.experiments
+
+    assert first.params == second.params
+    assert first.objective_result != second.objective_result
+
+
+def test_str_subclass_algo_passed():
+    class Algo(str, Enum):
+        RANDOM = "random"
+
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=10.0))
+
+    job = create_job(search_space=space)
+    job.do(lambda e: e.params["x"], n_trials=2,
+           algo_list=[Algo.RANDOM, np.str_("random")])
+
+    assert job.experiments_count == 2
+
+
 def test_incorrect_algo_passed():
     space = SearchSpace()
     job = create_job(search_space=space)
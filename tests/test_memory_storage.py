@@ -0,0 +1,67 @@
+import pytest
+
+from gimeltune import Experiment, MemoryStorage, Real, SearchSpace, create_job
+from gimeltune.exceptions import InsertExperimentWithTheExistedId
+from gimeltune.models.configuration import Configuration
+from gimeltune.models.experiment import ExperimentState
+
+
+def test_memory_storage():
+    storage = MemoryStorage()
+
+    class _Job:
+        def __init__(self, job_id, job_name):
+            self.id = job_id
+            self.name = job_name
+
+    experiments = [
+        Experiment(
+            id=i,
+            job_id=0,
+            state=ExperimentState.OK,
+            objective_result=float(2 - i),
+            create_timestamp=0.0,
+            params=Configuration({"x": float(i)}, requestor="foo"),
+        )
+        for i in range(3)
+    ]
+
+    storage.insert_job(_Job(0, "foo"))
+    storage.insert_job(_Job(0, "foo"))
+    storage.insert_experiments(experiments)
+
+    assert storage.jobs == [{"id": 0, "name": "foo"}]
+    assert storage.get_job_id_by_name("foo") == 0
+    assert storage.get_job_id_by_name("boo") is None
+
+    assert storage.get_experiments_count(0) == 3
+    assert storage.get_experiments_by_job_id(0) == experiments
+    assert storage.get_experiment(0, 1) == experiments[1]
+    assert storage.get_experiment(0, 1000) is None
+    assert storage.get_objective_results(0) == [2.0, 1.0, 0.0]
+    assert storage.best_experiment(0) == experiments[2]
+    assert storage.top_experiments(0, 2) == experiments[:0:-1]
+
+    with pytest.raises(InsertExperimentWithTheExistedId):
+        storage.insert_experiment(experiments[0])
+
+    # Returned experiments are copies of stored ones.
+    for returned in (storage.get_experiment(0, 1),
+                     storage.get_experiments_by_job_id(0)[1],
+                     storage.top_experiments(0, 2)[1]):
+        returned.objective_result = 100.0
+        returned.params["x"] = 100.0
+
+    assert storage.get_experiment(0, 1) == experiments[1]
+    assert storage.get_experiment(0, 1).params.requestor == "foo"
+
+
+def test_memory_storage_url():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    job = create_job(search_space=space, storage="memory://")
+    job.do(lambda e: e.params["x"], n_trials=5)
+
+    assert isinstance(job.storage, MemoryStorage)
+    assert len(job.dataframe) == 5
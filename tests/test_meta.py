@@ -43,3 +43,45 @@ def test_different_optimizers():
 
     print(job.best_parameters)
     print(job.rewards)
+
+
+def test_ucb_tell_bulk():
+    space = SearchSpace(
+        Real('x', low=0.0, high=1.0),
+        Real('y', low=0.0, high=1.0)
+    )
+
+    def make():
+        op = UCB1(GridSearch(search_space=space),
+                  TemplateSearchAlgorithm(search_space=space))
+        assert op.order
+        return op
+
+    one_by_one, bulk = make(), make()
+
+    configs = [c for algo in one_by_one.algorithms for c in algo.ask()] * 3
+    results = [3.0, 5.0, 2.0, 2.0, 1.0, 4.0]
+
+    for config, result in zip(configs, results):
+        one_by_one.tell(config, result)
+
+    bulk.tell_bulk(configs[:2], results[:2])
+    bulk.tell_bulk(configs[2:], results[2:])
+
+    assert bulk.results == one_by_one.results
+    assert np.array_equal(bulk.mab.n_rewards, one_by_one.mab.n_rewards)
+    assert bulk.mab.n_rewards.sum() == 3
+
+
+def test_parallel_asks():
+    space = SearchSpace(
+        Real('x', low=0.0, high=1.0),
+        Real('y', low=0.0, high=1.0)
+    )
+
+    job = create_job(search_space=space, optimizer=UCB1)
+    job.do(lambda e: e.params['x'] + e.params['y'], n_trials=30,
+           algo_list=['template', 'random', 'bayesian'], parallel=True)
+
+    assert job.optimizer.executor is None
+    assert len(job.dataframe) >= 30
@@ -1,7 +1,15 @@
+import numpy as np
+import pytest
 from sklearn.ensemble import AdaBoostRegressor, RandomForestRegressor
 from sklearn.neural_network import MLPRegressor
 
-from gimeltune import Experiment, Real, SearchSpace, create_job
+from gimeltune import (
+    Experiment,
+    Real,
+    SearchSpace,
+    batched_objective,
+    create_job,
+)
 
 
 # noinspection DuplicatedCode
@@ -22,13 +30,66 @@ def test_minimal():
     space.insert(Real("x", low=0.0, high=5.0))
     space.insert(Real("y", low=0.0, high=2.0))
 
-    job = create_job(search_space=space, storage="tinydb:///foo.json")
+    job = create_job(search_space=space, storage="memory://")
     job.do(objective, n_trials=50)
 
     assert abs(job.best_value - 0) < 5
     assert len(job.dataframe) == 50
 
 
+def test_batched_objective():
+    space = SearchSpace()
+
+    space.insert(Real("x", low=0.0, high=5.0))
+    space.insert(Real("y", low=0.0, high=2.0))
+
+    job = create_job(search_space=space, storage="memory://")
+    job.do(batched_objective(objective), n_trials=50, batch=16,
+           algo_list=["random"])
+
+    df = job.dataframe
+
+    assert len(df) == 50
+    # Vectorized powers may differ from scalar ones in the last bits.
+    assert np.allclose(df["objective_result"],
+                       [objective(e) for e in job.experiments])
+
+
+def test_batched_objective_without_pool(monkeypatch):
+    import gimeltune.jobs.job
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("Batched objective needs no workers.")
+
+    monkeypatch.setattr(gimeltune.jobs.job.mp, "get_context", no_pool)
+
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=5.0))
+
+    job = create_job(search_space=space, storage="memory://")
+    job.do(batched_objective(lambda batch: batch.params["x"]),
+           n_trials=4, batch=4, algo_list=["random"])
+
+    assert job.experiments_count == 4
+
+
+@pytest.mark.parametrize("results", [
+    lambda batch: batch.params["x"][:-1],
+    lambda batch: 1.0,
+])
+def test_batched_objective_results_count_checked(results):
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=5.0))
+
+    job = create_job(search_space=space, storage="memory://")
+
+    with pytest.raises(ValueError, match="must return 4 results"):
+        job.do(batched_objective(results), n_trials=8, batch=4,
+               algo_list=["random"])
+
+    assert job.experiments_count == 0
+
+
 def test_job_with_algo_ensemble():
     space = SearchSpace()
 
@@ -37,7 +98,7 @@ def test_job_with_algo_ensemble():
 
     job = create_job(
         search_space=space,
-        storage="tinydb:///foo.json",
+        storage="memory://",
         optimizer=ThompsonSampler
     )
 
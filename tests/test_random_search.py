@@ -1,7 +1,8 @@
+import random
 from unittest.mock import patch
 
 from gimeltune import (Categorical, Experiment, Integer,
-                       Real, SearchSpace, create_job)
+                       RandomSearch, Real, SearchSpace, create_job)
 
 
 def faked_random(nums):
@@ -47,3 +48,44 @@ def test_random_search(rr, ri, rc):
 
     assert job.best_parameters == {"w": "foo", "x": 0.8, "y": 0.9, "z": 0}
 
+
+def test_random_search_per_emit_count():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+    space.insert(Integer("z", low=0, high=2))
+    space.insert(Categorical("w", choices=["foo", None]))
+
+    algo = RandomSearch(search_space=space, per_emit_count=8)
+    configs = algo.ask()
+
+    assert len(configs) == 8
+
+    for cfg in configs:
+        assert list(cfg) == ["x", "z", "w"]
+        assert isinstance(cfg["x"], float) and 0.0 <= cfg["x"] <= 1.0
+        assert isinstance(cfg["z"], int) and 0 <= cfg["z"] <= 2
+        assert cfg["w"] in ["foo", None]
+        assert cfg.requestor == algo.name
+
+    assert len(RandomSearch(SearchSpace(), per_emit_count=3).ask()) == 3
+
+
+def test_random_search_seed():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+    space.insert(Integer("z", low=0, high=2))
+
+    def draws(count, **kwargs):
+        algo = RandomSearch(search_space=space, per_emit_count=count,
+                            **kwargs)
+        return [algo.ask() for _ in range(3)]
+
+    for count in (1, 8):
+        assert draws(count, seed=0) == draws(count, seed=0)
+        assert draws(count, seed=0) != draws(count, seed=1)
+
+        random.seed(42)
+        first = draws(count)
+        random.seed(42)
+
+        assert draws(count) == first
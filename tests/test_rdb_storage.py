@@ -1,7 +1,15 @@
+import pytest
+import sqlalchemy
+from sqlalchemy.exc import IntegrityError
+
 from gimeltune import Experiment, Real, SearchSpace, create_job
 from gimeltune.models.configuration import Configuration
 from gimeltune.models.experiment import ExperimentState
-from gimeltune.storages.rdb.storage import RDBStorage
+from gimeltune.storages.rdb.storage import (
+    RDBStorage,
+    _engine_options,
+    _is_sqlite_file,
+)
 
 
 def test_rdb_storage():
@@ -50,6 +58,13 @@ def test_rdb_storage():
 
     assert storage.jobs == [{"id": 0, "name": "foo"}, {"id": 1, "name": "boo"}]
 
+    # already stored job is skipped
+    storage.insert_job(mock_job)
+    assert storage.jobs_count == 2
+
+    with pytest.raises(IntegrityError):
+        storage.insert_job(_Job(2, "foo"))
+
 
 def test_integrated_rdb_storage():
     space = SearchSpace()
@@ -69,3 +84,83 @@ def test_integrated_rdb_storage():
     job.do(objective, n_trials=5)
 
     print(job.dataframe)
+
+
+def test_rdb_storage_insert_experiments():
+    storage = RDBStorage("sqlite:///:memory:")
+
+    experiments = [
+        Experiment(
+            id=i,
+            job_id=0,
+            state=ExperimentState.OK,
+            objective_result=float(i),
+            create_timestamp=0.0,
+            params=Configuration({"x": float(i)}, requestor="foo"),
+        )
+        for i in range(3)
+    ]
+
+    storage.insert_experiments(experiments)
+
+    assert storage.get_experiments_count(0) == 3
+    assert storage.get_experiments_by_job_id(0) == experiments
+    assert storage.best_experiment(0) == experiments[0]
+    assert storage.top_experiments(0, 2) == experiments[:2]
+
+
+def test_rdb_engine_options():
+    assert _engine_options("sqlite:///:memory:", pool_size=4) == {}
+
+    options = _engine_options("postgresql://user@localhost/db", pool_size=4)
+
+    assert options["pool_size"] == 4
+    assert options["max_overflow"] == 8
+    assert options["pool_pre_ping"]
+
+
+def test_rdb_pool_size_passed_from_create_job(monkeypatch):
+    import gimeltune.storages.rdb.storage as rdb
+
+    created = []
+
+    def fake_create_engine(url, **kwargs):
+        created.append((url, kwargs))
+        # Server is not needed, tables are created in memory.
+        return sqlalchemy.create_engine("sqlite://")
+
+    monkeypatch.setattr(rdb, "create_engine", fake_create_engine)
+
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    url = "postgresql://user@localhost/db"
+    job = create_job(search_space=space, storage=url, pool_size=3)
+
+    assert isinstance(job.storage, RDBStorage)
+    assert created == [(url, _engine_options(url, pool_size=3))]
+    assert created[0][1]["pool_size"] == 3
+
+    # SQLite storages drop pool size.
+    created.clear()
+    create_job(search_space=space, storage="sqlite:///:memory:",
+               pool_size=3)
+
+    assert created == [("sqlite:///:memory:", {})]
+
+
+def test_rdb_sqlite_file_pragmas():
+    assert not _is_sqlite_file("sqlite:///:memory:")
+    assert not _is_sqlite_file("sqlite://")
+    assert _is_sqlite_file("sqlite:///foo.db")
+
+    storage = RDBStorage("sqlite:///foo.db")
+
+    with storage.engine.connect() as connection:
+        assert connection.exec_driver_sql(
+            "PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql(
+            "PRAGMA synchronous").scalar() == 1  # NORMAL
+
+    storage.session.close()
+    storage.engine.dispose()
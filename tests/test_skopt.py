@@ -1,5 +1,5 @@
 from gimeltune import (Categorical, Experiment, Integer,
-                       Real, SearchSpace, create_job)
+                       Real, SearchSpace, SkoptBayesianAlgorithm, create_job)
 
 
 # noinspection DuplicatedCode
@@ -21,3 +21,25 @@ def test_skopt():
 
     job = create_job(search_space=space)
     job.do(objective, n_trials=10, algo_list=["skopt"])
+
+
+def test_skopt_optimizer_kwargs():
+    space = SearchSpace()
+
+    space.insert(Real("x", low=0.0, high=5.0))
+    space.insert(Real("y", low=0.0, high=2.0))
+
+    algo = SkoptBayesianAlgorithm(
+        search_space=space,
+        optimizer_kwargs={
+            "n_initial_points": 3,
+            "acq_optimizer_kwargs": {"n_points": 500},
+        },
+    )
+
+    assert algo.optimizer_instance.n_points == 500
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=6, algo_list=[algo])
+
+    assert len(job.dataframe) == 6
@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
-from gimeltune.search import SearchSpace
-from gimeltune.search.space import from_yaml
+from gimeltune.search import Categorical, Integer, Real, SearchSpace
+from gimeltune.search.space import CATEGORICAL, INTEGER, REAL, from_yaml
 
 
 def test_space_from_yaml():
@@ -70,3 +71,40 @@ def test_incorrect_yaml_parameter_type():
 
     with pytest.raises(TypeError):
         SearchSpace.from_yaml(doc)
+
+
+def test_space_bounds_arrays():
+    space = SearchSpace()
+    space.insert(Integer("x", low=0, high=2))
+    space.insert(Real("y", low=0.5, high=1.0))
+
+    assert np.array_equal(space.lows, [0.0, 0.5])
+    assert np.array_equal(space.highs, [2.0, 1.0])
+
+    space.insert(Categorical("z", choices=["foo", "bar", None]))
+
+    assert np.array_equal(space.kinds, [INTEGER, REAL, CATEGORICAL])
+    assert np.array_equal(space.lows, [0.0, 0.5, 0.0])
+    assert np.array_equal(space.highs, [2.0, 1.0, 2.0])
+
+    points = space.sample(100, np.random.default_rng(0))
+
+    assert points.shape == (100, 3)
+    assert np.all((space.lows <= points) & (points <= space.highs))
+
+
+def test_space_getter():
+    space = SearchSpace()
+    space.insert(Integer("x", low=0, high=2))
+    space.insert(Real("y", low=0.5, high=1.0))
+
+    params = {"x": 1, "y": 0.75}
+
+    assert space.getter("x", "y")(params) == (1, 0.75)
+    assert space.getter("y")(params) == 0.75
+
+    with pytest.raises(KeyError):
+        space.getter("z")
+
+    with pytest.raises(ValueError):
+        space.getter()